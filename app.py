@@ -3,18 +3,28 @@ Main Flask Application File
 This initializes the Flask app and ties together Models, Views, and Controllers
 """
 from flask import Flask
-from model.car import db
+from sqlalchemy import event, insert, inspect, select
+from sqlalchemy.pool import QueuePool
+from model.car import Car, db
 from controller.car_controller import car_bp
 import os
 
 
-def create_app():
-    """Application factory function"""
-    app = Flask(__name__, 
+def create_app(debug=False):
+    """
+    Application factory function
+
+    Args:
+        debug (bool): Enable Flask debug mode. Must be passed here (not
+            just to app.run) so debug-dependent config like template
+            auto-reload is decided correctly.
+    """
+    app = Flask(__name__,
                 template_folder='view',
                 static_folder='view/static',
                 static_url_path='/static')
-    
+    app.debug = debug
+
     # Configuration
     app.config['SECRET_KEY'] = 'your-secret-key-here-change-in-production'
     # Database stored in repository layer (where data access happens)
@@ -22,7 +32,31 @@ def create_app():
     db_path = os.path.join(basedir, 'model', 'repository', 'instance', 'cars.db')
     app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{db_path}'
     app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
-    
+
+    # Connection pooling (performance)
+    # SQLite's default pool opens and closes the .db file around every
+    # request. A small QueuePool keeps long-lived connections that are
+    # reused across requests, so connection setup happens only a handful
+    # of times per process - while each concurrent request still checks
+    # out its own connection (the threaded dev server would otherwise
+    # interleave transactions on a single shared one).
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+        'poolclass': QueuePool,
+        'pool_size': 5,
+        'connect_args': {'check_same_thread': False},
+    }
+
+    # Template caching (performance)
+    # By default Jinja stats every template file on each render to see if it
+    # changed. Outside debug mode the templates are static, so skip the
+    # per-request file checks and keep compiled templates cached in memory.
+    # In debug mode nothing is set, so auto-reload stays on and template
+    # edits show up without a restart.
+    if not debug:
+        app.config['TEMPLATES_AUTO_RELOAD'] = False
+        app.jinja_env.auto_reload = False
+    app.jinja_env.cache = {}  # unbounded cache of compiled templates
+
     # Initialize database
     db.init_app(app)
     
@@ -31,19 +65,37 @@ def create_app():
     
     # Create database tables
     with app.app_context():
-        db.create_all()
-        
+        # SQLite tuning pragmas, applied whenever a new connection is opened.
+        # WAL mode lets readers and the writer work concurrently, and the
+        # remaining pragmas trade a little durability for less disk I/O.
+        @event.listens_for(db.engine, 'connect')
+        def _set_sqlite_pragmas(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            cursor.execute('PRAGMA journal_mode=WAL')
+            cursor.execute('PRAGMA synchronous=NORMAL')
+            cursor.execute('PRAGMA temp_store=MEMORY')
+            cursor.execute('PRAGMA cache_size=-64000')
+            cursor.close()
+
+        # Only build the schema when it's actually missing - create_all
+        # re-inspects every table on each call, which is wasted work for
+        # every worker process after the first boot
+        if not inspect(db.engine).has_table('cars'):
+            db.create_all()
+
         # Add some sample data if database is empty
-        from model.car import Car
-        if Car.query.count() == 0:
+        # An "is there any row at all" probe stops at the first row,
+        # unlike COUNT(*) which scans the whole table on every boot
+        if db.session.execute(select(Car.id).limit(1)).first() is None:
+            # Insert all seed rows in one executemany statement - one
+            # prepared INSERT with N parameter sets, no per-instance ORM work
             sample_cars = [
-                Car(make='Toyota', model='Camry', year=2023, color='Blue', price=28500.00),
-                Car(make='Honda', model='Civic', year=2022, color='Silver', price=24000.00),
-                Car(make='Ford', model='Mustang', year=2024, color='Red', price=45000.00),
-                Car(make='Tesla', model='Model 3', year=2023, color='White', price=42000.00),
+                dict(make='Toyota', model='Camry', year=2023, color='Blue', price=28500.00),
+                dict(make='Honda', model='Civic', year=2022, color='Silver', price=24000.00),
+                dict(make='Ford', model='Mustang', year=2024, color='Red', price=45000.00),
+                dict(make='Tesla', model='Model 3', year=2023, color='White', price=42000.00),
             ]
-            for car in sample_cars:
-                db.session.add(car)
+            db.session.execute(insert(Car), sample_cars)
             db.session.commit()
             print("✓ Sample data added to database")
     
@@ -51,7 +103,7 @@ def create_app():
 
 
 if __name__ == '__main__':
-    app = create_app()
+    app = create_app(debug=True)
     print("\n" + "="*50)
     print("🚗 Car Management System Started!")
     print("="*50)
@@ -19,12 +19,29 @@ from model.repository.car_repository import CarRepository
 # Create a Blueprint for car routes
 car_bp = Blueprint('car', __name__)
 
+# URL cache for argument-less endpoints (performance)
+# The routing map is static once the blueprint is registered, so URLs like
+# '/' never change - build each one on first use and reuse it afterwards
+# instead of re-running url_for's map lookup on every redirect
+_static_urls = {}
+
+
+def _cached_url(endpoint):
+    """Return the URL for an argument-less endpoint, building it only once"""
+    url = _static_urls.get(endpoint)
+    if url is None:
+        url = _static_urls[endpoint] = url_for(endpoint)
+    return url
+
 
 @car_bp.route('/')
 def index():
     """Display all cars - READ operation"""
-    cars = CarRepository.find_all()  # Using repository
-    return render_template('index.html', cars=cars)
+    # Read-only rows are enough for the list page - cheaper than full
+    # ORM objects, and the template can't tell the difference
+    cars = CarRepository.find_all_rows()  # Using repository
+    stats = CarRepository.price_stats()  # Aggregates computed in SQL
+    return render_template('index.html', cars=cars, stats=stats)
 
 
 @car_bp.route('/car/new', methods=['GET'])
@@ -49,15 +66,15 @@ def create_car():
                                        color=color, price=price)
         
         flash(f'Successfully added {new_car.full_name}!', 'success')
-        return redirect(url_for('car.index'))
+        return redirect(_cached_url('car.index'))
     except ValueError as e:
         # Validation errors from repository
         flash(f'Validation error: {str(e)}', 'error')
-        return redirect(url_for('car.new_car'))
+        return redirect(_cached_url('car.new_car'))
     except Exception as e:
         # Other errors
         flash(f'Error adding car: {str(e)}', 'error')
-        return redirect(url_for('car.new_car'))
+        return redirect(_cached_url('car.new_car'))
 
 
 @car_bp.route('/car/<int:id>')
@@ -108,7 +125,7 @@ def delete_car(id):
         car_info = CarRepository.delete(id)
         
         flash(f'Successfully deleted {car_info["full_name"]}!', 'success')
-        return redirect(url_for('car.index'))
+        return redirect(_cached_url('car.index'))
     except Exception as e:
         flash(f'Error deleting car: {str(e)}', 'error')
-        return redirect(url_for('car.index'))
+        return redirect(_cached_url('car.index'))
@@ -7,8 +7,11 @@ ARCHITECTURE NOTE:
 - Repository: Business logic and database operations (car_repository.py)
 
 IMPORTANT FOR INTERNS:
-The db.Column definitions below are for SQLAlchemy ORM (Object-Relational Mapping).
-They tell SQLAlchemy how to map between database columns and Python objects.
+The Mapped[...] annotations below are for SQLAlchemy ORM (Object-Relational
+Mapping). They tell SQLAlchemy how to map between database columns and
+Python objects. The model is declared as a *mapped dataclass*
+(MappedAsDataclass), which generates the __init__ for us from the field
+declarations and keeps the field set fixed and explicit.
 
 When you CREATE a Car instance, these become regular Python primitives:
     car = Car(make='Toyota', model='Camry', year=2024, color='Blue', price=30000)
@@ -16,17 +19,52 @@ When you CREATE a Car instance, these become regular Python primitives:
     car.year   → int
     car.price  → float
 """
+import operator
+
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import Float, Index, Integer, String
+from sqlalchemy.orm import DeclarativeBase, Mapped, MappedAsDataclass, mapped_column
+
+# Serialization field order, plus an attrgetter captured once at import
+# time: one C-level call fetches all six values, instead of six separate
+# instrumented-attribute lookups per to_dict() call
+_FIELDS = ('id', 'make', 'model', 'year', 'color', 'price')
+_get_fields = operator.attrgetter(*_FIELDS)
+
+# Sales tax multiplier (8%), precomputed so price_with_tax is a single
+# multiply. Shared with CarRepository.price_stats so both always agree.
+TAX_MULTIPLIER = 1.08
 
-db = SQLAlchemy()
 
-class Car(db.Model):
+class Base(MappedAsDataclass, DeclarativeBase):
+    """
+    Declarative base with dataclass semantics
+
+    MappedAsDataclass makes every model a real dataclass: the field set
+    is fixed and declared in one place, and __init__ is generated from
+    the declarations instead of written by hand. (Instances are still
+    __dict__-backed like classic declarative models - this is about
+    declaration style, not per-instance memory.)
+    """
+
+
+db = SQLAlchemy(model_class=Base)
+
+
+class Car(db.Model, eq=False):
     """
     Car entity - represents a car in the database
-    
+
     This is a "thin" model that only defines the data structure.
     Business logic and database operations are handled by CarRepository.
-    
+
+    Because the model is a mapped dataclass, __init__ is generated from
+    the fields below (id is excluded via init=False - the database
+    assigns it). eq=False plus the explicit __eq__/__hash__ assignments
+    below opt out of dataclass-generated field-based equality, which
+    would also have made instances unhashable; cars keep the default
+    identity-based ==/hash they always had.
+
     Instance Attributes (actual Python types when you use them):
         id (int): Unique identifier (auto-generated)
         make (str): Car manufacturer (e.g., 'Toyota')
@@ -36,84 +74,74 @@ class Car(db.Model):
         price (float): Car price (e.g., 30000.00)
     """
     __tablename__ = 'cars'
-    
+
+    # Indexes backing the repository's filtered queries:
+    # - (make, year) serves find_by_make (equality on the leading column)
+    #   and any future make+year filter
+    # - year alone serves find_by_year_range (B-tree range scan)
+    # Without these, both queries are full table scans.
+    __table_args__ = (
+        Index('ix_cars_make_year', 'make', 'year'),
+    )
+
     # ORM Field Definitions (for database mapping)
     # These define the database schema, but instances will have primitive values
-    id = db.Column(db.Integer, primary_key=True)        # → int (auto-increment)
-    make = db.Column(db.String(50), nullable=False)     # → str (max 50 chars)
-    model = db.Column(db.String(50), nullable=False)    # → str (max 50 chars)
-    year = db.Column(db.Integer, nullable=False)        # → int
-    color = db.Column(db.String(30), nullable=False)    # → str (max 30 chars)
-    price = db.Column(db.Float, nullable=False)         # → float
-    
-    def __init__(self, make: str, model: str, year: int, color: str, price: float):
-        """
-        Initialize a car instance with the given attributes
-        
-        Args:
-            make (str): Car manufacturer
-            model (str): Car model
-            year (int): Manufacturing year
-            color (str): Car color
-            price (float): Car price
-            
-        After initialization, all fields are PRIMITIVE Python types:
-            self.make is a str
-            self.year is an int
-            self.price is a float
-        """
-        # Assign primitive values to instance
-        self.make = make      # str
-        self.model = model    # str
-        self.year = year      # int
-        self.color = color    # str
-        self.price = price    # float
-    
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, init=False)  # → int (auto-increment)
+    make: Mapped[str] = mapped_column(String(50))     # → str (max 50 chars)
+    model: Mapped[str] = mapped_column(String(50))    # → str (max 50 chars)
+    year: Mapped[int] = mapped_column(Integer, index=True)  # → int
+    color: Mapped[str] = mapped_column(String(30))    # → str (max 30 chars)
+    price: Mapped[float] = mapped_column(Float)       # → float
+
+    # Identity-based equality and hashing, as on the baseline model.
+    # eq=False stops the dataclass machinery from generating field-based
+    # __eq__ here, but Flask-SQLAlchemy's generated db.Model base class
+    # was itself dataclass-processed with the defaults (its __hash__ is
+    # None), so the identity dunders must be restored explicitly.
+    __eq__ = object.__eq__
+    __hash__ = object.__hash__
+
     def __repr__(self):
         """String representation of the car"""
         return f'<Car {self.year} {self.make} {self.model}>'
-    
+
     def to_dict(self):
         """Convert car object to dictionary for JSON serialization"""
-        return {
-            'id': self.id,
-            'make': self.make,
-            'model': self.model,
-            'year': self.year,
-            'color': self.color,
-            'price': self.price
-        }
-    
+        return dict(zip(_FIELDS, _get_fields(self)))
+
     # Computed properties (no database operations)
-    
+
     @property
     def full_name(self):
         """Return the full name of the car"""
         return f'{self.year} {self.make} {self.model}'
-    
+
     @property
-    def price_with_tax(self, tax_rate=0.08):
+    def price_with_tax(self):
         """Calculate price with tax (example of business logic in model)"""
-        return self.price * (1 + tax_rate)
+        # Note: this used to take a tax_rate argument, but a property only
+        # ever receives self, so the argument was dead code - the rate now
+        # lives in the module-level TAX_MULTIPLIER constant
+        return self.price * TAX_MULTIPLIER
 
 
 # ============================================================================
 # FOR INTERNS: Understanding Fields
 # ============================================================================
 #
-# COMMON CONFUSION: "Are the fields db.Column objects or primitives?"
+# COMMON CONFUSION: "Are the fields Mapped[...] descriptors or primitives?"
 #
 # ANSWER: It depends on when you look at them!
 #
-# 1. AT CLASS LEVEL (Car.make) - It's a db.Column descriptor
-#    Used by SQLAlchemy to create the database schema
+# 1. AT CLASS LEVEL (Car.make) - It's a mapped column descriptor
+#    Used by SQLAlchemy to create the database schema and build queries
 #
 # 2. AT INSTANCE LEVEL (car.make) - It's a primitive Python value!
 #    Used by your code in templates, logic, etc.
 #
 # EXAMPLE:
 #
-#   # Create a car instance
+#   # Create a car instance (the dataclass-generated __init__)
 #   car = Car(make='Toyota', model='Camry', year=2024, color='Blue', price=30000.00)
 #
 #   # Now these are all PRIMITIVE types:
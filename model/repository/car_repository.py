@@ -11,7 +11,17 @@ RESPONSIBILITY:
 The Repository Pattern sits between the Controller and Model:
 Controller -> Repository -> Model -> Database
 """
-from model.car import Car, db
+from flask import abort, g
+from sqlalchemy import func, lambda_stmt, literal, select, delete as sql_delete, update as sql_update
+from sqlalchemy.orm import raiseload
+
+from model.car import TAX_MULTIPLIER, Car, db
+
+# Validation bounds (module-level constants so the validators don't
+# rebuild them per call)
+MIN_YEAR = 1900
+MAX_YEAR = 2030
+MAX_PRICE = 10000000  # 10 million cap
 
 
 class CarRepository:
@@ -68,8 +78,36 @@ class CarRepository:
         """
         # Explicitly query the database session for all Car records
         # This is equivalent to: SELECT * FROM cars
-        return db.session.query(Car).all()
-    
+        #
+        # raiseload('*') is an N+1 guard: Car has no relationships today,
+        # but once one is added, an accidental lazy load on a find_all()
+        # result raises immediately instead of silently issuing one query
+        # per row. Relationship-aware callers must opt in explicitly with
+        # selectinload().
+        return db.session.scalars(
+            select(Car).options(raiseload('*'))
+        ).all()
+
+    @staticmethod
+    def find_all_rows():
+        """
+        Retrieve all cars as lightweight read-only rows
+
+        Unlike find_all(), this selects plain columns instead of Car
+        entities, so no ORM objects are built - each result is a dict-like
+        RowMapping. Templates can use these exactly like Car instances
+        ({{ car.make }} works the same), which makes this the cheaper
+        choice for read-only list pages.
+
+        Returns:
+            list[RowMapping]: One mapping per car
+        """
+        # Core-level column select - skips ORM hydration per row
+        # This is equivalent to: SELECT id, make, model, year, color, price FROM cars
+        return db.session.execute(
+            select(Car.id, Car.make, Car.model, Car.year, Car.color, Car.price)
+        ).mappings().all()
+
     @staticmethod
     def find_by_id(car_id):
         """
@@ -84,15 +122,24 @@ class CarRepository:
         Raises:
             404: If car not found
         """
+        # Per-request cache: a single request may look up the same car more
+        # than once (controller + template helpers). Store lookups on
+        # flask.g so repeats within one request hit a dict, not the database
+        cache = getattr(g, '_car_cache', None)
+        if cache is None:
+            cache = g._car_cache = {}
+        if car_id in cache:
+            return cache[car_id]
+
         # Explicitly get a Car record by primary key (ID)
         # This is equivalent to: SELECT * FROM cars WHERE id = ?
         car = db.session.get(Car, car_id)
-        
+
         # If not found, raise a 404 error
         if car is None:
-            from flask import abort
             abort(404)
-        
+
+        cache[car_id] = car
         return car
     
     @staticmethod
@@ -115,29 +162,37 @@ class CarRepository:
             ValueError: If validation fails
             404: If car not found
         """
-        # First, get the car from the database
-        car = db.session.get(Car, car_id)
-        if car is None:
-            from flask import abort
-            abort(404)
-        
-        # Update only provided fields
-        if make is not None:
-            car.make = make
-        if model is not None:
-            car.model = model
+        # Validate provided fields before touching the database
         if year is not None:
             CarRepository._validate_year(year)
-            car.year = year
-        if color is not None:
-            car.color = color
         if price is not None:
             CarRepository._validate_price(price)
-            car.price = price
-        
+
+        # Collect only the fields that were provided
+        values = {key: value for key, value in
+                  dict(make=make, model=model, year=year,
+                       color=color, price=price).items()
+                  if value is not None}
+        if not values:
+            # Nothing to change - just return the car (404s if missing)
+            return CarRepository.find_by_id(car_id)
+
+        # Issue a single UPDATE ... RETURNING statement
+        # This is equivalent to: UPDATE cars SET ... WHERE id = ? RETURNING *
+        # One round trip instead of a SELECT followed by an UPDATE
+        stmt = sql_update(Car).where(Car.id == car_id).values(**values).returning(Car)
+        car = db.session.execute(stmt).scalar_one_or_none()
+
+        # If no row matched, the car doesn't exist
+        if car is None:
+            db.session.rollback()
+            abort(404)
+
         # Save changes to the database
-        # SQLAlchemy tracks changes to objects and updates them on commit
         db.session.commit()
+
+        # Drop the per-request cache so stale rows can't be served
+        g.pop('_car_cache', None)
         return car
     
     @staticmethod
@@ -154,29 +209,32 @@ class CarRepository:
         Raises:
             404: If car not found
         """
-        # First, get the car from the database
-        car = db.session.get(Car, car_id)
-        if car is None:
-            from flask import abort
+        # Issue a single DELETE ... RETURNING statement
+        # This is equivalent to: DELETE FROM cars WHERE id = ? RETURNING ...
+        # One round trip instead of a SELECT followed by a DELETE
+        stmt = (sql_delete(Car)
+                .where(Car.id == car_id)
+                .returning(Car.id, Car.make, Car.model, Car.year))
+        row = db.session.execute(stmt).first()
+
+        # If no row matched, the car doesn't exist
+        if row is None:
+            db.session.rollback()
             abort(404)
-        
-        # Save info before deleting
-        car_info = {
-            'id': car.id,
-            'full_name': car.full_name,
-            'make': car.make,
-            'model': car.model,
-            'year': car.year
-        }
-        
-        # Mark the car for deletion
-        # This is equivalent to: DELETE FROM cars WHERE id = ?
-        db.session.delete(car)
-        
+
         # Execute the delete operation
         db.session.commit()
-        
-        return car_info
+
+        # Drop the per-request cache so stale rows can't be served
+        g.pop('_car_cache', None)
+
+        return {
+            'id': row.id,
+            'full_name': f'{row.year} {row.make} {row.model}',
+            'make': row.make,
+            'model': row.model,
+            'year': row.year
+        }
     
     @staticmethod
     def find_by_make(make):
@@ -206,7 +264,12 @@ class CarRepository:
         """
         # Query with a comparison operator
         # This is equivalent to: SELECT * FROM cars WHERE price >= ?
-        return db.session.query(Car).filter(Car.price >= min_price).all()
+        #
+        # lambda_stmt caches the compiled SQL keyed on the lambda itself,
+        # so repeat calls skip statement construction and compilation and
+        # only bind the new min_price value
+        stmt = lambda_stmt(lambda: select(Car).where(Car.price >= min_price))
+        return db.session.scalars(stmt).all()
     
     @staticmethod
     def find_by_year_range(start_year, end_year):
@@ -222,11 +285,40 @@ class CarRepository:
         """
         # Query with multiple conditions (AND)
         # This is equivalent to: SELECT * FROM cars WHERE year >= ? AND year <= ?
-        return db.session.query(Car).filter(
+        #
+        # Cached-compilation form, same as find_expensive_cars: the SQL is
+        # compiled once and the year bounds are bound per call
+        stmt = lambda_stmt(lambda: select(Car).where(
             Car.year >= start_year,
             Car.year <= end_year
-        ).all()
+        ))
+        return db.session.scalars(stmt).all()
     
+    @staticmethod
+    def price_stats():
+        """
+        Aggregate price statistics across all cars
+
+        The arithmetic runs inside SQLite's SUM/AVG aggregates in a single
+        table scan, instead of looping over Car instances in Python - one
+        query regardless of how many cars there are.
+
+        Returns:
+            dict: 'total', 'mean' and 'total_with_tax' as floats
+                  (all zero when there are no cars)
+        """
+        # One query computing both aggregates
+        # This is equivalent to: SELECT SUM(price), AVG(price) FROM cars
+        total, mean = db.session.execute(
+            select(func.coalesce(func.sum(Car.price), 0.0),
+                   func.coalesce(func.avg(Car.price), 0.0))
+        ).one()
+        return {
+            'total': total,
+            'mean': mean,
+            'total_with_tax': total * TAX_MULTIPLIER  # matches Car.price_with_tax
+        }
+
     @staticmethod
     def count():
         """
@@ -235,9 +327,13 @@ class CarRepository:
         Returns:
             int: Total count of cars
         """
-        # Count all cars in the database
-        # This is equivalent to: SELECT COUNT(*) FROM cars
-        return db.session.query(Car).count()
+        # Count all cars in the database with a direct aggregate
+        # This is exactly: SELECT COUNT(*) FROM cars
+        # (Query.count() would wrap the select in a subquery, which SQLite
+        # executes less efficiently than the plain aggregate)
+        return db.session.execute(
+            select(func.count()).select_from(Car)
+        ).scalar()
     
     @staticmethod
     def exists(car_id):
@@ -250,10 +346,10 @@ class CarRepository:
         Returns:
             bool: True if car exists, False otherwise
         """
-        # Query for a car with this ID and get the first result (or None)
-        # This is equivalent to: SELECT * FROM cars WHERE id = ? LIMIT 1
-        car = db.session.query(Car).filter_by(id=car_id).first()
-        return car is not None
+        # Select a constant instead of the row itself - no columns are
+        # fetched and no Car object is built just to test truthiness
+        # This is equivalent to: SELECT 1 FROM cars WHERE id = ? LIMIT 1
+        return db.session.query(literal(True)).filter(Car.id == car_id).scalar() is not None
     
     # Private validation methods
     
@@ -261,7 +357,11 @@ class CarRepository:
     def _validate_car_data(make, model, year, color, price):
         """
         Validate all car data before creating/updating
-        
+
+        The year/price rules live in _validate_year/_validate_price so
+        there is exactly one copy of each check - partial updates call
+        the same helpers.
+
         Raises:
             ValueError: If any validation fails
         """
@@ -271,28 +371,28 @@ class CarRepository:
             raise ValueError('Model is required')
         if not color or not color.strip():
             raise ValueError('Color is required')
-        
+
         CarRepository._validate_year(year)
         CarRepository._validate_price(price)
-    
+
     @staticmethod
     def _validate_year(year):
         """
         Validate car year
-        
+
         Raises:
             ValueError: If year is invalid
         """
         if not isinstance(year, int):
             raise ValueError('Year must be an integer')
-        if year < 1900 or year > 2030:
-            raise ValueError('Year must be between 1900 and 2030')
-    
+        if year < MIN_YEAR or year > MAX_YEAR:
+            raise ValueError(f'Year must be between {MIN_YEAR} and {MAX_YEAR}')
+
     @staticmethod
     def _validate_price(price):
         """
         Validate car price
-        
+
         Raises:
             ValueError: If price is invalid
         """
@@ -300,5 +400,5 @@ class CarRepository:
             raise ValueError('Price must be a number')
         if price < 0:
             raise ValueError('Price cannot be negative')
-        if price > 10000000:  # 10 million cap
+        if price > MAX_PRICE:
             raise ValueError('Price is unreasonably high')